@@ -1,10 +1,14 @@
 import streamlit as st
 import pandas as pd
 from utils.calculations import CircuitCalculator
-from utils.validators import validate_input
+from utils.validators import validate_inputs, REQUIRED_FIELDS, OPTIONAL_FIELDS
 from utils.mosfet_selector import suggest_mosfets
 from utils.inductor_selector import suggest_inductors
 from utils.capacitor_selector import suggest_capacitors
+from utils.component_library import query_components
+from utils.catalog_manager import CatalogManager
+from utils.design_store import DesignStore
+from utils.fs_optimizer import optimize_switching_frequency
 
 # Custom CSS for better styling
 def load_css():
@@ -46,53 +50,314 @@ def load_css():
         </style>
     """, unsafe_allow_html=True)
 
+@st.cache_resource
+def get_catalog_manager():
+    """Start one catalog manager per server process that polls the asset files."""
+    manager = CatalogManager()
+    manager.start()
+    return manager
+
+@st.cache_resource
+def get_design_store():
+    """Open the persistent design store once per server process."""
+    return DesignStore()
+
+def load_design(circuit_type, inputs, snapshot):
+    """
+    Serve a design from the store, or calculate it when it is not stored.
+
+    Designs are keyed on the content id of the catalog snapshot that the
+    component suggestions are drawn from.
+
+    Returns:
+        tuple: (results, parts, catalog version, stored parts); parts holds
+        any component suggestions stored with the design and stored parts is
+        the set of their kinds, or None if the design was not in the store
+    """
+    catalog_version = snapshot.content_id
+    try:
+        stored = get_design_store().get(circuit_type, inputs, catalog_version)
+    except Exception as e:
+        st.warning(str(e))
+        stored = None
+    if stored:
+        return stored["results"], stored["parts"], catalog_version, set(stored["parts"])
+
+    calculator = CircuitCalculator()
+    return calculator.calculate(circuit_type, inputs), {}, catalog_version, None
+
+def save_design(circuit_type, inputs, results, catalog_version, parts, stored_parts):
+    """Persist a design unless the store already holds it with the same parts."""
+    if stored_parts is not None and set(parts) == stored_parts:
+        return
+    try:
+        get_design_store().put(circuit_type, inputs, results, catalog_version, parts)
+    except Exception as e:
+        st.warning(str(e))
+
+def show_input_errors(input_errors):
+    """List every rejected input field with the reason it failed validation."""
+    st.error(
+        "Please check your input values:\n" +
+        "\n".join(f"- {field}: {reason}" for field, reason in input_errors.items())
+    )
+
+def show_fs_optimization(circuit_type, inputs, catalogs):
+    """Show the loss-minimizing switching frequency for the parts of a catalog snapshot."""
+    st.markdown("### Switching Frequency Optimization")
+    try:
+        candidates = optimize_switching_frequency(
+            circuit_type, inputs,
+            mosfets_df=catalogs["mosfets"],
+            inductors_df=catalogs["inductors"],
+            top_k=10
+        )
+        if candidates:
+            best = candidates[0]
+            st.success(
+                f"Minimum loss {best['Total Loss']:.2f} W at "
+                f"{best['Switching Frequency']/1e3:.1f} kHz with "
+                f"{best['MOSFET']} and {best['Inductor']}"
+            )
+            # Core loss needs core material data the catalogs do not have
+            table = pd.DataFrame(candidates).drop(columns=['Core Loss'])
+            table['Switching Frequency'] = table['Switching Frequency'] / 1e3
+            table['Inductance'] = table['Inductance'] * 1e6
+            table['Output Capacitance'] = table['Output Capacitance'] * 1e6
+            table = table.rename(columns={
+                'Switching Frequency': 'Fs (kHz)',
+                'Total Loss': 'Total Loss (W)',
+                'Conduction Loss': 'Conduction (W)',
+                'Switching Loss': 'Switching (W)',
+                'Gate Loss': 'Gate (W)',
+                'Winding Loss': 'Winding (W)',
+                'Inductance': 'Inductance (µH)',
+                'Ripple Current': 'Ripple (A)',
+                'Output Capacitance': 'Output C (µF)'
+            })
+            st.dataframe(table, hide_index=True)
+        else:
+            st.info("No MOSFET/inductor pair meets the requirements within the frequency range.")
+    except Exception as e:
+        st.error(str(e))
+
+def show_catalog_page(key, df, columns, range_filters, category_filters,
+                      display_units=None, highlight_min=None, highlight_max=None):
+    """
+    Render one filtered, sorted and paginated page of a component catalog.
+
+    Args:
+        key (str): Widget key prefix for this catalog
+        df (DataFrame): Normalized catalog
+        columns (list): Columns shown in the table
+        range_filters (list): (column, label, scale) tuples for numeric filters
+        category_filters (list): (column, label) tuples for multiselect filters
+        display_units (dict): Column -> (label, scale) applied to the visible page
+        highlight_min (list): Columns whose page minimum is highlighted
+        highlight_max (list): Columns whose page maximum is highlighted
+    """
+    with st.expander("Filters", expanded=False):
+        ranges = {}
+        range_cols = st.columns(max(len(range_filters), 1))
+        for col, (column, label, scale) in zip(range_cols, range_filters):
+            with col:
+                low = float(df[column].min() / scale)
+                high = float(df[column].max() / scale)
+                min_key, max_key = f"{key}_{column}_min", f"{key}_{column}_max"
+                bounds_key = f"{key}_{column}_bounds"
+                previous = st.session_state.get(bounds_key)
+                if previous != (low, high):
+                    # Bounds the user has not moved follow the catalog when it reloads
+                    if previous is None or st.session_state.get(min_key) == previous[0]:
+                        st.session_state[min_key] = low
+                    if previous is None or st.session_state.get(max_key) == previous[1]:
+                        st.session_state[max_key] = high
+                    st.session_state[bounds_key] = (low, high)
+                min_value = st.number_input(f"Min {label}", key=min_key)
+                max_value = st.number_input(f"Max {label}", key=max_key)
+                # Bounds left at the catalog extremes are not applied, so rows are
+                # not dropped by float round-off in the unit conversion
+                ranges[column] = (
+                    min_value * scale if min_value > low else None,
+                    max_value * scale if max_value < high else None
+                )
+
+        categories = {}
+        category_cols = st.columns(max(len(category_filters), 1))
+        for col, (column, label) in zip(category_cols, category_filters):
+            with col:
+                options = sorted(df[column].dropna().unique().tolist())
+                categories[column] = st.multiselect(label, options, key=f"{key}_{column}_cat")
+
+    sort_col1, sort_col2, sort_col3, sort_col4 = st.columns(4)
+    with sort_col1:
+        sort_by = st.selectbox("Sort by", ["(none)"] + columns, key=f"{key}_sort")
+    with sort_col2:
+        ascending = st.radio("Order", ["Ascending", "Descending"], key=f"{key}_order", horizontal=True) == "Ascending"
+    with sort_col3:
+        page_size = st.selectbox("Rows per page", [25, 50, 100], key=f"{key}_page_size")
+
+    page_key, query_key = f"{key}_page", f"{key}_query"
+    query = (ranges, categories, sort_by, ascending, page_size)
+    if st.session_state.get(query_key) != query:
+        # A changed filter or sort starts again from the first page
+        st.session_state[page_key] = 1
+        st.session_state[query_key] = query
+
+    page_df, total_rows, page_count, page = query_components(
+        df,
+        ranges=ranges,
+        categories=categories,
+        sort_by=None if sort_by == "(none)" else sort_by,
+        ascending=ascending,
+        page=st.session_state[page_key],
+        page_size=page_size,
+        columns=columns
+    )
+
+    # The page widget is rendered after the query so it shows the clamped page
+    st.session_state[page_key] = page
+    with sort_col4:
+        st.number_input("Page", key=page_key, min_value=1, max_value=page_count, step=1)
+
+    # Unit conversion and styling are applied to the visible page only
+    renames = {}
+    for column, (label, scale) in (display_units or {}).items():
+        page_df = page_df.assign(**{column: page_df[column] / scale})
+        renames[column] = label
+    page_df = page_df.rename(columns=renames)
+
+    styler = page_df.style
+    if highlight_min:
+        styler = styler.highlight_min(subset=[renames.get(c, c) for c in highlight_min], color='lightgreen')
+    if highlight_max:
+        styler = styler.highlight_max(subset=[renames.get(c, c) for c in highlight_max], color='lightblue')
+
+    st.caption(f"Showing page {page} of {page_count} ({total_rows} matching parts)")
+    st.dataframe(styler, height=400, hide_index=True)
+
 def show_components_library():
     st.title("Components Library")
     
     # Load datasets
     try:
-        mosfets_df = pd.read_csv("Assets/optivolt_mosfet_dataset.csv")
-        caps_df = pd.read_csv("Assets/powercrux_output_cap_dataset_starter.csv")
-        inductors_df = pd.read_csv("Assets/Top_Inductors_2025.csv")
+        snapshot = get_catalog_manager().snapshot
+        catalogs = snapshot.catalogs
+        st.caption(f"Catalog version {snapshot.version}")
         
         tab1, tab2, tab3 = st.tabs(["MOSFETs", "Capacitors", "Inductors"])
         
         with tab1:
             st.header("MOSFETs Database")
             # Show MOSFET data with highlighting
-            st.dataframe(
-                mosfets_df[[
-                    'MOSFET Name', 'Vds (V)', 'Rds(on) (mΩ)', 'Continuous Id (A)',
-                    'Package', 'Efficiency Range', 'Typical Use'
-                ]].style.highlight_min(
-                    subset=['Rds(on) (mΩ)'],
-                    color='lightgreen'
-                ).highlight_max(
-                    subset=['Continuous Id (A)'],
-                    color='lightblue'
-                ),
-                height=400
+            show_catalog_page(
+                "lib_mosfet",
+                catalogs["mosfets"],
+                columns=[
+                    'Part Name', 'Input Voltage', 'Rds(on) (mΩ)', 'Current Rating',
+                    'Package Type', 'Manufacturer', 'Efficiency Range', 'Typical Use'
+                ],
+                range_filters=[
+                    ('Input Voltage', 'Voltage (V)', 1.0),
+                    ('Current Rating', 'Current (A)', 1.0)
+                ],
+                category_filters=[
+                    ('Manufacturer', 'Manufacturer'),
+                    ('Package Type', 'Package')
+                ],
+                highlight_min=['Rds(on) (mΩ)'],
+                highlight_max=['Current Rating']
             )
             
         with tab2:
             st.header("Capacitors Database")
-            st.dataframe(
-                caps_df[[
+            show_catalog_page(
+                "lib_cap",
+                catalogs["capacitors"],
+                columns=[
                     'Manufacturer', 'Series', 'PartNumber', 'Type',
-                    'Capacitance_uF', 'Voltage_V', 'Case', 'ESR_mOhm',
+                    'Capacitance', 'Voltage Rating', 'Case', 'ESR',
                     'Temp_Range_C', 'Life_hrs'
-                ]].style.highlight_max(subset=['Capacitance_uF'], color='lightgreen')
-                     .highlight_min(subset=['ESR_mOhm'], color='lightblue'),
-                height=400
+                ],
+                range_filters=[
+                    ('Capacitance', 'Capacitance (µF)', 1e-6),
+                    ('Voltage Rating', 'Voltage (V)', 1.0)
+                ],
+                category_filters=[
+                    ('Manufacturer', 'Manufacturer'),
+                    ('Case', 'Package')
+                ],
+                display_units={
+                    'Capacitance': ('Capacitance (µF)', 1e-6),
+                    'ESR': ('ESR (mΩ)', 1.0)
+                },
+                highlight_min=['ESR'],
+                highlight_max=['Capacitance']
             )
             
         with tab3:
             st.header("Inductors Database")
-            st.dataframe(inductors_df, height=400)
+            show_catalog_page(
+                "lib_ind",
+                catalogs["inductors"],
+                columns=[
+                    'Part Name', 'Inductance', 'Current Rating', 'DC Resistance',
+                    'Efficiency', 'Package Type', 'Brand', 'Price'
+                ],
+                range_filters=[
+                    ('Inductance', 'Inductance (µH)', 1e-6),
+                    ('Current Rating', 'Current (A)', 1.0)
+                ],
+                category_filters=[
+                    ('Brand', 'Manufacturer'),
+                    ('Package Type', 'Package')
+                ],
+                display_units={
+                    'Inductance': ('Inductance (µH)', 1e-6)
+                }
+            )
             
     except Exception as e:
         st.error(f"Error loading component databases: {str(e)}")
 
+def show_batch_designer():
+    st.title("Batch Designer")
+    
+    circuit_type = st.selectbox("Circuit Type", ["Synchronous Buck", "Totem Pole PFC"], key="batch_type")
+    st.markdown(
+        "Upload a CSV with one design per row and the columns: " +
+        ", ".join(f"`{field}`" for field in REQUIRED_FIELDS[circuit_type])
+    )
+    if OPTIONAL_FIELDS[circuit_type]:
+        st.caption(
+            "Optional: " + ", ".join(f"`{field}`" for field in OPTIONAL_FIELDS[circuit_type]) +
+            ". Rows that fill in all of them also get the transient capacitance."
+        )
+    uploaded = st.file_uploader("Design specs (CSV)", type="csv", key="batch_file")
+    if uploaded is None:
+        return
+
+    try:
+        batch = pd.read_csv(uploaded)
+        calculator = CircuitCalculator()
+        # Invalid rows are dropped before the calculation
+        designs, rejected = calculator.calculate_batch(circuit_type, batch)
+        
+        st.success(f"Calculated {len(designs)} of {len(batch)} designs")
+        st.dataframe(designs, hide_index=True)
+        st.download_button(
+            "Download Results",
+            designs.to_csv(index=False),
+            file_name="designs.csv",
+            mime="text/csv"
+        )
+        
+        if len(rejected):
+            st.warning(f"{len(rejected)} rows failed validation")
+            st.dataframe(rejected, hide_index=True)
+    except Exception as e:
+        st.error(f"Batch calculation error: {str(e)}")
+
 def main():
     st.set_page_config(
         page_title="Circuit Designer",
@@ -104,12 +369,16 @@ def main():
     
     # Navigation
     st.sidebar.title("Navigation")
-    page = st.sidebar.radio("Select Page", ["Circuit Designer", "Components Library"])
+    page = st.sidebar.radio("Select Page", ["Circuit Designer", "Batch Designer", "Components Library"])
     
     if page == "Components Library":
         show_components_library()
         return
 
+    if page == "Batch Designer":
+        show_batch_designer()
+        return
+
     if page == "Circuit Designer":
         st.title("⚡ Circuit Designer")
         st.markdown("""
@@ -145,6 +414,8 @@ def main():
             switching_freq = st.number_input("Switching Frequency (Hz)", key="pfc_fs", min_value=0.0, value=65000.0)
             line_freq_min = st.number_input("Min Line Frequency (Hz)", key="pfc_fline", min_value=0.0, value=50.0)
 
+        pfc_optimize_fs = st.checkbox("Optimize switching frequency for minimum loss", key="pfc_opt_fs")
+
         if st.button("Calculate Component Values", key="pfc_calc_btn"):
             inputs = {
                 "v_in_min": v_in_min,
@@ -158,15 +429,21 @@ def main():
                 "v_ripple_max": v_ripple_max
             }
 
-            if validate_input(inputs):
+            input_errors = validate_inputs("Totem Pole PFC", inputs)
+            if not input_errors:
                 try:
-                    calculator = CircuitCalculator()
-                    results = calculator.calculate("Totem Pole PFC", inputs)
+                    # One snapshot per calculation, so every suggestion comes from the same catalogs
+                    snapshot = get_catalog_manager().snapshot
+                    catalogs = snapshot.catalogs
+                    results, parts, catalog_version, stored_parts = load_design("Totem Pole PFC", inputs, snapshot)
                     
                     st.markdown("### Calculated Values")
                     st.write(f"Inductance = {results['inductance']*1000:.2f} mH")
                     st.write(f"Capacitance = {results['capacitance']*1e6:.2f} μF")
                     st.write(f"Ripple Current = {results['ripple_current']:.2f} A")
+
+                    if pfc_optimize_fs:
+                        show_fs_optimization("Totem Pole PFC", inputs, catalogs)
                     
                     # Component suggestions section
                     st.markdown("### Suggested Components")
@@ -174,7 +451,9 @@ def main():
                     # MOSFET suggestions
                     with st.expander("🔌 Suggested MOSFETs"):
                         try:
-                            mosfets = suggest_mosfets(v_in_max, results['ripple_current'])
+                            if "mosfets" not in parts:
+                                parts["mosfets"] = suggest_mosfets(v_in_max, results['ripple_current'], catalogs["mosfets"])[:3]
+                            mosfets = parts["mosfets"]
                             if mosfets:
                                 for idx, mosfet in enumerate(mosfets[:3]):
                                     with st.container():
@@ -196,7 +475,9 @@ def main():
                     # Inductor suggestions
                     with st.expander("🛠️ Suggested Inductors"):
                         try:
-                            inductors = suggest_inductors(results['inductance'], results['ripple_current'])
+                            if "inductors" not in parts:
+                                parts["inductors"] = suggest_inductors(results['inductance'], results['ripple_current'], catalogs["inductors"])[:3]
+                            inductors = parts["inductors"]
                             if inductors:
                                 for idx, inductor in enumerate(inductors[:3]):
                                     with st.container():
@@ -217,7 +498,9 @@ def main():
                     # Capacitor suggestions
                     with st.expander("💾 Suggested Capacitors"):
                         try:
-                            capacitors = suggest_capacitors(results['capacitance'], v_out_max)
+                            if "capacitors" not in parts:
+                                parts["capacitors"] = suggest_capacitors(results['capacitance'], v_out_max, catalogs["capacitors"])[:3]
+                            capacitors = parts["capacitors"]
                             if capacitors:
                                 for idx, capacitor in enumerate(capacitors[:3]):
                                     with st.container():
@@ -267,10 +550,12 @@ def main():
                                 st.info("No suitable capacitors found for the calculated requirements.")
                         except Exception as e:
                             st.error(f"Error suggesting capacitors: {str(e)}")
+
+                    save_design("Totem Pole PFC", inputs, results, catalog_version, parts, stored_parts)
                 except Exception as e:
                     st.error(f"Calculation error: {str(e)}")
             else:
-                st.error("Please check your input values. All values must be positive.")
+                show_input_errors(input_errors)
 
     with tab2:
         st.subheader("Buck Converter Parameters")
@@ -300,6 +585,8 @@ def main():
             buck_v_undershoot = st.number_input("Voltage Undershoot (V)", key="buck_vunder", min_value=0.0, value=0.1)
             buck_i_loadstep = st.number_input("Load Step (A)", key="buck_istep", min_value=0.0, value=1.0)
 
+        buck_optimize_fs = st.checkbox("Optimize switching frequency for minimum loss", key="buck_opt_fs")
+
         if st.button("Calculate Component Values", key="buck_calc_btn"):
             inputs = {
                 "v_in_min": buck_v_in_min,
@@ -317,16 +604,22 @@ def main():
                 "i_loadstep": buck_i_loadstep
             }
 
-            if validate_input(inputs):
+            input_errors = validate_inputs("Synchronous Buck", inputs)
+            if not input_errors:
                 try:
-                    calculator = CircuitCalculator()
-                    results = calculator.calculate("Synchronous Buck", inputs)
+                    # One snapshot per calculation, so every suggestion comes from the same catalogs
+                    snapshot = get_catalog_manager().snapshot
+                    catalogs = snapshot.catalogs
+                    results, parts, catalog_version, stored_parts = load_design("Synchronous Buck", inputs, snapshot)
                     
                     st.markdown("### Calculated Values")
                     st.write(f"Inductance = {results['inductance']*1e6:.2f} μH")
                     st.write(f"Output Capacitance = {results['output_capacitance']*1e6:.2f} μF")
                     st.write(f"Input Capacitance = {results['input_capacitance']*1e6:.2f} μF")
                     st.write(f"Maximum Duty Cycle = {results['duty_cycle_max']*100:.1f}%")
+
+                    if buck_optimize_fs:
+                        show_fs_optimization("Synchronous Buck", inputs, catalogs)
                     
                     # MOSFET suggestions
                     st.markdown("### Suggested MOSFETs")
@@ -334,7 +627,9 @@ def main():
                         # Calculate maximum current
                         max_current = buck_p_out_max / buck_v_out_min * (1 + buck_i_out_ripple)
                         st.info(f"Looking for MOSFETs with: Voltage ≥ {buck_v_in_max:.1f}V, Current ≥ {max_current:.1f}A")
-                        mosfets = suggest_mosfets(buck_v_in_max, max_current)
+                        if "mosfets" not in parts:
+                            parts["mosfets"] = suggest_mosfets(buck_v_in_max, max_current, catalogs["mosfets"])[:3]
+                        mosfets = parts["mosfets"]
                         if mosfets:
                             for idx, mosfet in enumerate(mosfets[:3]):  # Show top 3 suggestions
                                 with st.expander(f"Option {idx + 1}: {mosfet['Part Name']}"):
@@ -349,10 +644,12 @@ def main():
                             st.info("No suitable MOSFETs found for the calculated requirements.")
                     except Exception as e:
                         st.error(f"Error suggesting MOSFETs: {str(e)}")
+
+                    save_design("Synchronous Buck", inputs, results, catalog_version, parts, stored_parts)
                 except Exception as e:
                     st.error(f"Calculation error: {str(e)}")
             else:
-                st.error("Please check your input values. All values must be positive.")
+                show_input_errors(input_errors)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,131 @@
+import itertools
+import os
+import shutil
+import pandas as pd
+import pytest
+from utils.catalog_manager import CatalogManager
+from utils.mosfet_selector import MOSFET_DATA_PATH, normalize_mosfet_data
+
+NEW_ROW = "NEWFET,100,3.0,40,TO-220,90,\"Buck, test\",Low-side,95–97%,Acme,https://example.com/newfet.pdf\n"
+
+_mtimes = itertools.count(1_700_000_000 * 10**9, 10**9)
+
+def touch(path):
+    """Give each write a distinct mtime regardless of filesystem timer resolution."""
+    mtime = next(_mtimes)
+    os.utime(path, ns=(mtime, mtime))
+
+def append(path, text):
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(text)
+    touch(path)
+
+def rewrite(path, old, new):
+    with open(path, encoding='utf-8') as f:
+        text = f.read()
+    assert old in text
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text.replace(old, new, 1))
+    touch(path)
+
+@pytest.fixture
+def path(tmp_path):
+    path = str(tmp_path / "mosfets.csv")
+    shutil.copy(MOSFET_DATA_PATH, path)
+    touch(path)
+    return path
+
+@pytest.fixture
+def manager(path):
+    return CatalogManager({"mosfets": (path, normalize_mosfet_data)})
+
+def assert_matches_file(manager, path):
+    expected = normalize_mosfet_data(pd.read_csv(path))
+    pd.testing.assert_frame_equal(manager.snapshot.catalogs["mosfets"], expected, check_dtype=False)
+    # Incremental loads hash to the same content id as a fresh full load
+    fresh = CatalogManager({"mosfets": (path, normalize_mosfet_data)})
+    assert manager.snapshot.content_id == fresh.snapshot.content_id
+
+def test_initial_load(manager, path):
+    assert manager.version == 1
+    assert_matches_file(manager, path)
+    assert manager.refresh() is False
+    touch(path)
+    assert manager.refresh() is False
+    assert manager.version == 1
+
+def test_pure_append(manager, path):
+    previous = manager.snapshot
+    append(path, NEW_ROW)
+    assert manager.refresh() is True
+    assert manager.version == 2
+    assert_matches_file(manager, path)
+    # The published snapshot is replaced, not modified
+    assert len(previous.catalogs["mosfets"]) == len(manager.snapshot.catalogs["mosfets"]) - 1
+
+def test_append_with_partial_line(manager, path):
+    append(path, NEW_ROW + "PARTIAL,1")
+    assert manager.refresh() is True
+    names = manager.snapshot.catalogs["mosfets"]["Part Name"].tolist()
+    assert names[-1] == "NEWFET"
+    assert "PARTIAL" not in names
+
+    append(path, "00,3.0,40,TO-220,90,test,Low-side,95–97%,Acme,https://example.com/partial.pdf\n")
+    assert manager.refresh() is True
+    assert manager.snapshot.catalogs["mosfets"]["Part Name"].iloc[-1] == "PARTIAL"
+    assert manager.snapshot.catalogs["mosfets"]["Input Voltage"].iloc[-1] == 100
+    assert_matches_file(manager, path)
+
+def test_content_id_covers_parsed_bytes(manager, path, tmp_path):
+    initial = manager.snapshot.content_id
+    touch(path)
+    manager.refresh()
+    assert manager.snapshot.content_id == initial
+
+    append(path, NEW_ROW + "PARTIAL,1")
+    assert manager.refresh() is True
+    assert manager.snapshot.content_id != initial
+    # The partial line is not parsed yet, so it is not part of the id
+    with open(path, 'rb') as f:
+        data = f.read()
+    complete = tmp_path / "complete.csv"
+    complete.write_bytes(data[:data.rfind(b'\n') + 1])
+    parsed = CatalogManager({"mosfets": (str(complete), normalize_mosfet_data)})
+    assert manager.snapshot.content_id == parsed.snapshot.content_id
+
+def test_edit_in_middle_of_file(manager, path):
+    rewrite(path, "BSC340N08NS3G,80,", "BSC340N08NS3G,85,")
+    assert manager.refresh() is True
+    catalog = manager.snapshot.catalogs["mosfets"]
+    assert catalog.loc[catalog["Part Name"] == "BSC340N08NS3G", "Input Voltage"].item() == 85
+    assert_matches_file(manager, path)
+
+def test_changed_header(manager, path):
+    with open(path, encoding='utf-8') as f:
+        header, *rows = f.read().splitlines()
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("\n".join([header + ",Price"] + [row + ",1.5" for row in rows]) + "\n")
+    touch(path)
+    assert manager.refresh() is True
+    assert (manager.snapshot.catalogs["mosfets"]["Price"] == 1.5).all()
+    assert_matches_file(manager, path)
+
+def test_quoted_multiline_field(manager, path):
+    rewrite(path, '"Mid-power buck, low loss"', '"Mid-power buck,\nlow loss"')
+    assert manager.refresh() is True
+    assert_matches_file(manager, path)
+    assert manager.snapshot.catalogs["mosfets"]["Typical Use"].iloc[0] == "Mid-power buck,\nlow loss"
+
+    # Later appends still match a full parse
+    append(path, NEW_ROW)
+    assert manager.refresh() is True
+    assert_matches_file(manager, path)
+
+def test_failed_refresh_keeps_snapshot(manager, path):
+    previous = manager.snapshot
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("")
+    touch(path)
+    assert manager.refresh() is False
+    assert manager.snapshot is previous
+    assert manager.last_error
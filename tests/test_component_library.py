@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+from utils.component_library import filter_components, query_components
+
+CATALOG = pd.DataFrame({
+    "Part Name": ["A", "B", "C", "D", "E"],
+    "Current Rating": [1.0, 2.0, np.nan, 4.0, 5.0],
+    "Package": ["SMD", "THT", "SMD", "SMD", "THT"],
+    "Price": [0.1, 0.2, 0.3, 0.4, 0.5],
+}, index=[10, 11, 12, 13, 14])
+
+def test_range_bounds_are_inclusive():
+    assert filter_components(CATALOG, ranges={"Current Rating": (2.0, 4.0)}).tolist() == [11, 13]
+    # A None bound leaves that side open; NaN never matches a set bound
+    assert filter_components(CATALOG, ranges={"Current Rating": (None, 2.0)}).tolist() == [10, 11]
+    assert filter_components(CATALOG, ranges={"Current Rating": (4.0, None)}).tolist() == [13, 14]
+    assert filter_components(CATALOG, ranges={"Current Rating": (None, None)}).tolist() == [10, 11, 12, 13, 14]
+
+def test_empty_category_list_means_all():
+    assert filter_components(CATALOG, categories={"Package": []}).tolist() == [10, 11, 12, 13, 14]
+    assert filter_components(CATALOG, categories={"Package": ["THT"]}).tolist() == [11, 14]
+
+def test_nan_sorts_last():
+    for ascending in (True, False):
+        page_df, _, _, _ = query_components(CATALOG, sort_by="Current Rating", ascending=ascending)
+        assert page_df["Part Name"].iloc[-1] == "C"
+    page_df, _, _, _ = query_components(CATALOG, sort_by="Current Rating", ascending=False)
+    assert page_df["Part Name"].tolist() == ["E", "D", "B", "A", "C"]
+
+def test_page_is_clamped():
+    _, total_rows, page_count, page = query_components(CATALOG, page=9, page_size=2)
+    assert (total_rows, page_count, page) == (5, 3, 3)
+    assert query_components(CATALOG, page=0, page_size=2)[3] == 1
+    # No matches still gives one (empty) page
+    page_df, total_rows, page_count, page = query_components(
+        CATALOG, categories={"Package": ["BGA"]}, page=4
+    )
+    assert (len(page_df), total_rows, page_count, page) == (0, 0, 1, 1)
+
+def test_page_holds_requested_columns_of_page_rows():
+    page_df, _, _, _ = query_components(
+        CATALOG, sort_by="Price", ascending=False, page=2, page_size=2,
+        columns=["Part Name", "Price"]
+    )
+    assert page_df.columns.tolist() == ["Part Name", "Price"]
+    assert page_df.index.tolist() == [12, 11]
+    pd.testing.assert_frame_equal(page_df, CATALOG.loc[[12, 11], ["Part Name", "Price"]])
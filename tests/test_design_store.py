@@ -0,0 +1,64 @@
+import itertools
+import sqlite3
+import pytest
+from utils import design_store
+from utils.design_store import DesignStore, design_key
+
+BUCK = "Synchronous Buck"
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Strictly increasing time so LRU order does not depend on timer resolution."""
+    ticks = itertools.count(1000.0)
+    monkeypatch.setattr(design_store.time, "time", lambda: next(ticks))
+
+@pytest.fixture
+def store(tmp_path, clock):
+    return DesignStore(str(tmp_path / "designs.sqlite3"), max_entries=3)
+
+def buck_inputs(switching_freq):
+    return {"v_in_max": 24.0, "v_out_max": 5.0, "p_out_max": 50.0, "switching_freq": switching_freq}
+
+def test_design_key_normalizes_inputs():
+    a = design_key(BUCK, {"v_in_max": 24, "switching_freq": 500e3}, "v1")
+    b = design_key(BUCK, {"switching_freq": 500000.0000000001, "v_in_max": 24.0}, "v1")
+    assert a == b
+    assert a != design_key(BUCK, {"v_in_max": 24, "switching_freq": 500e3}, "v2")
+    assert a != design_key("Totem Pole PFC", {"v_in_max": 24, "switching_freq": 500e3}, "v1")
+
+def test_get_returns_stored_design(store):
+    store.put(BUCK, buck_inputs(500e3), {"inductance": 1e-6}, "v1", {"mosfets": [{"Part Name": "A"}]})
+    stored = store.get(BUCK, buck_inputs(500e3), "v1")
+    assert stored == {"results": {"inductance": 1e-6}, "parts": {"mosfets": [{"Part Name": "A"}]}}
+    assert store.get(BUCK, buck_inputs(500e3), "v2") is None
+
+def test_evicts_least_recently_used(store):
+    for fs in (100e3, 200e3, 300e3):
+        store.put(BUCK, buck_inputs(fs), {}, "v1")
+    # Reading the oldest entry makes 200 kHz the least recently used
+    assert store.get(BUCK, buck_inputs(100e3), "v1") is not None
+    store.put(BUCK, buck_inputs(400e3), {}, "v1")
+
+    assert store.get(BUCK, buck_inputs(200e3), "v1") is None
+    remaining = sorted(d["inputs"]["switching_freq"] for d in store.query())
+    assert remaining == [100e3, 300e3, 400e3]
+
+def test_query_switching_frequency_range(store):
+    for fs in (300e3, 400e3, 500e3):
+        store.put(BUCK, buck_inputs(fs), {}, "v1")
+    store.put("Totem Pole PFC", buck_inputs(600e3), {}, "v1")
+
+    designs = store.query(BUCK, ranges={"switching_freq": (400e3, None)})
+    assert sorted(d["inputs"]["switching_freq"] for d in designs) == [400e3, 500e3]
+    with pytest.raises(ValueError):
+        store.query(BUCK, ranges={"efficiency": (0.9, None)})
+
+def test_put_existing_design_keeps_created(store):
+    key = store.put(BUCK, buck_inputs(500e3), {}, "v1")
+    store.put(BUCK, buck_inputs(500e3), {}, "v1", {"mosfets": []})
+    with sqlite3.connect(store.path) as conn:
+        created, last_access, parts = conn.execute(
+            "SELECT created, last_access, parts FROM designs WHERE key = ?", (key,)
+        ).fetchone()
+    assert created < last_access
+    assert parts == '{"mosfets": []}'
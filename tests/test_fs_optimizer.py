@@ -0,0 +1,104 @@
+import pandas as pd
+import pytest
+from utils import fs_optimizer
+from utils.calculations import CircuitCalculator
+from utils.fs_optimizer import optimize_switching_frequency
+
+BUCK = "Synchronous Buck"
+BUCK_INPUTS = {
+    "v_in_min": 12.0, "v_in_max": 24.0, "v_out_min": 3.3, "v_out_max": 5.0,
+    "p_out_max": 3.0, "efficiency": 0.95, "switching_freq": 500e3,
+    "v_ripple_max": 0.05, "v_in_ripple": 0.1, "i_out_ripple": 0.5
+}
+# Assumed ferrite core loss, high enough for an interior optimum with L1
+CORE_LOSS_COEFFICIENT = 2e4
+
+def mosfet(name, rds_on, q_g):
+    return {"Part Name": name, "Input Voltage": 30.0, "Current Rating": 60.0,
+            "Rds(on) (mΩ)": rds_on, "Qg (nC)": q_g}
+
+def inductor(name, inductance, current_rating, dcr):
+    return {"Part Name": name, "Inductance": inductance, "Current Rating": current_rating,
+            "DC Resistance": dcr}
+
+MOSFETS = pd.DataFrame([mosfet("FET", 3.0, 14.0)])
+INDUCTORS = pd.DataFrame([inductor("L1", 1e-3, 2.0, "0.1Ω")])
+
+def optimize(mosfets_df=MOSFETS, inductors_df=INDUCTORS, **kwargs):
+    return optimize_switching_frequency(
+        BUCK, BUCK_INPUTS, mosfets_df=mosfets_df, inductors_df=inductors_df, **kwargs
+    )
+
+def test_finds_interior_minimum():
+    fs_min, fs_max = 20e3, 2e6
+    (best,) = optimize(fs_min=fs_min, fs_max=fs_max, core_loss_coefficient=CORE_LOSS_COEFFICIENT)
+    f_s = best["Switching Frequency"]
+    assert fs_min * 1.5 < f_s < fs_max / 1.5
+
+    # Both neighbours lose more than the optimum
+    for neighbour in (f_s / 1.2, f_s * 1.2):
+        (pinned,) = optimize(fs_min=neighbour, fs_max=neighbour,
+                             core_loss_coefficient=CORE_LOSS_COEFFICIENT)
+        assert pinned["Total Loss"] > best["Total Loss"]
+
+    # A dense single-pass scan lands on the same frequency
+    (dense,) = optimize(fs_min=fs_min, fs_max=fs_max, grid_points=4000, refinements=1,
+                        core_loss_coefficient=CORE_LOSS_COEFFICIENT)
+    assert dense["Switching Frequency"] == pytest.approx(f_s, rel=0.01)
+
+def test_ripple_follows_fs_with_catalog_inductance():
+    inductors = pd.DataFrame([inductor("L100", 100e-6, 2.0, "0.1Ω")])
+    (best,) = optimize(inductors_df=inductors)
+    calculator = CircuitCalculator()
+    f_s = best["Switching Frequency"]
+    d_max = calculator.calculate_duty_cycle_max(BUCK_INPUTS["v_out_max"], BUCK_INPUTS["v_in_min"])
+    ripple = (BUCK_INPUTS["v_in_max"] - BUCK_INPUTS["v_out_min"]) * d_max / (100e-6 * f_s)
+
+    assert best["Inductance"] == 100e-6
+    assert best["Ripple Current"] == pytest.approx(ripple)
+    assert best["Output Capacitance"] == pytest.approx(calculator.calculate_buck_output_cap_ripple(
+        ripple, f_s, BUCK_INPUTS["v_ripple_max"]
+    ))
+    # Without core loss the ripple losses alone do not outweigh switching,
+    # so the optimum is the lowest Fs that meets the ripple spec
+    assert best["Ripple Current"] == pytest.approx(BUCK_INPUTS["i_out_ripple"])
+    assert best["Core Loss"] == 0
+
+def test_saturation_sets_lowest_frequency():
+    # 0.91 A load: a 1.3 A rating leaves 0.35 A peak-to-peak ripple below
+    # rating / 1.2, tighter than the 0.5 A spec
+    inductors = pd.DataFrame([inductor("SAT", 1e-3, 1.3, "0.1Ω")])
+    (best,) = optimize(inductors_df=inductors)
+    i_load = BUCK_INPUTS["p_out_max"] / BUCK_INPUTS["v_out_min"]
+    assert i_load + best["Ripple Current"] / 2 == pytest.approx(1.3 / 1.2)
+
+    assert optimize(inductors_df=pd.DataFrame([inductor("SMALL", 1e-3, 1.0, "0.1Ω")])) == []
+
+def test_prunes_dominated_parts_and_keeps_top_k(monkeypatch):
+    mosfets = pd.DataFrame([
+        mosfet("FET", 3.0, 14.0),
+        mosfet("WORSE", 4.0, 20.0),
+        mosfet("TRADE", 2.0, 30.0),
+    ])
+    inductors = pd.DataFrame([
+        inductor("L1", 1e-3, 2.0, "0.1Ω"),
+        inductor("L1-LOSSY", 1e-3, 2.0, "0.2Ω"),
+        inductor("L2", 2e-3, 2.0, "0.15Ω"),
+    ])
+    kwargs = dict(core_loss_coefficient=CORE_LOSS_COEFFICIENT, top_k=None)
+    results = optimize(mosfets, inductors, **kwargs)
+    assert {(r["MOSFET"], r["Inductor"]) for r in results} == {
+        ("FET", "L1"), ("FET", "L2"), ("TRADE", "L1"), ("TRADE", "L2")
+    }
+    totals = [r["Total Loss"] for r in results]
+    assert totals == sorted(totals)
+
+    # Chunked evaluation with a running top-k returns the same best pairs
+    monkeypatch.setattr(fs_optimizer, "CHUNK_SIZE", 32)
+    top = optimize(mosfets, inductors, **dict(kwargs, top_k=2))
+    assert top == results[:2]
+
+def test_invalid_inputs_raise():
+    with pytest.raises(Exception, match="duty cycle"):
+        optimize_switching_frequency(BUCK, dict(BUCK_INPUTS, v_out_max=13.0),
+                                     mosfets_df=MOSFETS, inductors_df=INDUCTORS)
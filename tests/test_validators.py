@@ -0,0 +1,91 @@
+import pandas as pd
+import pytest
+from utils.calculations import CircuitCalculator
+from utils.validators import drop_invalid, validate_batch, validate_inputs
+
+BUCK = "Synchronous Buck"
+PFC = "Totem Pole PFC"
+BUCK_INPUTS = {
+    "v_in_min": 12.0, "v_in_max": 24.0, "v_out_min": 3.3, "v_out_max": 5.0,
+    "p_out_max": 50.0, "efficiency": 0.95, "switching_freq": 500e3,
+    "v_ripple_max": 0.05, "v_in_ripple": 0.1, "i_out_ripple": 0.5,
+    "v_overshoot": 0.1, "v_undershoot": 0.1, "i_loadstep": 1.0
+}
+PFC_INPUTS = {
+    "v_in_min": 100.0, "v_in_max": 240.0, "v_out_min": 380.0, "v_out_max": 400.0,
+    "p_out_max": 3000.0, "efficiency": 0.98, "switching_freq": 65e3,
+    "line_freq_min": 50.0, "v_ripple_max": 20.0
+}
+
+def test_valid_inputs_have_no_errors():
+    assert validate_inputs(BUCK, BUCK_INPUTS) == {}
+    assert validate_inputs(PFC, PFC_INPUTS) == {}
+
+def test_per_row_per_field_reasons():
+    batch = pd.DataFrame([
+        BUCK_INPUTS,
+        dict(BUCK_INPUTS, v_out_max=15.0),
+        dict(BUCK_INPUTS, efficiency=1.2),
+        dict(BUCK_INPUTS, p_out_max=-1.0),
+        dict(BUCK_INPUTS, v_in_ripple="abc"),
+    ])
+    valid, errors = validate_batch(BUCK, batch)
+    assert valid.tolist() == [True, False, False, False, False]
+    assert errors.loc[1, "v_out_max"] == "must be below v_in_min (duty cycle would exceed 1)"
+    assert errors.loc[2, "efficiency"] == "must not exceed 1"
+    assert errors.loc[3, "p_out_max"] == "must be positive"
+    assert errors.loc[4, "v_in_ripple"] == "must be a number"
+    # Only the offending field is flagged
+    assert (errors.loc[1].drop("v_out_max") == "").all()
+
+def test_missing_and_topology_fields():
+    errors = validate_inputs(PFC, dict(PFC_INPUTS, v_out_min=300.0, v_ripple_max=None))
+    assert errors == {
+        "v_out_min": "must exceed the peak input voltage (√2 × v_in_max)",
+        "v_ripple_max": "is required",
+    }
+    inputs = dict(BUCK_INPUTS)
+    del inputs["switching_freq"]
+    assert validate_inputs(BUCK, inputs) == {"switching_freq": "is required"}
+
+def test_drop_invalid_splits_batch():
+    batch = pd.DataFrame([BUCK_INPUTS, dict(BUCK_INPUTS, v_undershoot=4.0, efficiency=0.0)])
+    valid, rejected = drop_invalid(BUCK, batch)
+    assert valid.index.tolist() == [0]
+    assert rejected.loc[1, "Errors"] == "efficiency must be positive; v_undershoot must be below v_out_min"
+
+def test_calculate_batch_matches_single_calculation():
+    calculator = CircuitCalculator()
+    batch = pd.DataFrame([
+        BUCK_INPUTS,
+        dict(BUCK_INPUTS, v_out_max=15.0),
+        dict(BUCK_INPUTS, switching_freq=1e6),
+    ])
+    designs, rejected = calculator.calculate_batch(BUCK, batch)
+    assert designs.index.tolist() == [0, 2]
+    assert rejected.index.tolist() == [1]
+    for index, row in designs.iterrows():
+        expected = calculator.calculate(BUCK, batch.loc[index].to_dict())
+        for name, value in expected.items():
+            assert row[name] == pytest.approx(value)
+
+def test_blank_optional_fields_are_not_provided():
+    blank = dict(BUCK_INPUTS, v_undershoot=None, v_overshoot=None, i_loadstep=None)
+    partial = dict(BUCK_INPUTS, v_overshoot=None)
+    batch = pd.DataFrame([BUCK_INPUTS, blank, partial, dict(blank, v_undershoot=-1.0)])
+    valid, errors = validate_batch(BUCK, batch)
+    assert valid.tolist() == [True, True, True, False]
+    assert errors.loc[3, "v_undershoot"] == "must be positive"
+    assert validate_inputs(BUCK, blank) == {}
+
+    calculator = CircuitCalculator()
+    designs, rejected = calculator.calculate_batch(BUCK, batch)
+    assert designs.index.tolist() == [0, 1, 2]
+    assert rejected.index.tolist() == [3]
+    # Only the row with all three transient fields gets the transient capacitance
+    full = calculator.calculate(BUCK, BUCK_INPUTS)
+    assert designs.loc[0, "output_capacitance"] == pytest.approx(full["output_capacitance"])
+    assert full["output_capacitance"] > full["output_cap_ripple"]
+    assert designs["output_cap_transient"].isna().tolist() == [False, True, True]
+    for index in (1, 2):
+        assert designs.loc[index, "output_capacitance"] == pytest.approx(full["output_cap_ripple"])
@@ -1,4 +1,7 @@
 import math
+import numpy as np
+import pandas as pd
+from utils.validators import drop_invalid
 
 class CircuitCalculator:
     def __init__(self):
@@ -56,7 +59,7 @@ class CircuitCalculator:
         c_undershoot = (l * i_loadstep**2) / (2 * v_undershoot * (v_in_max - v_out_min) * d_max)
         # For overshoot
         c_overshoot = (l * i_loadstep**2) / (2 * v_overshoot * v_out_max)
-        return max(c_undershoot, c_overshoot)
+        return np.maximum(c_undershoot, c_overshoot)
 
     def calculate_buck_input_cap(self, p_out_max, efficiency, v_in_min, d_max, f_s, v_in_ripple):
         """
@@ -95,7 +98,7 @@ class CircuitCalculator:
             )
 
             # Calculate output capacitance based on transient if parameters provided
-            if all(key in inputs for key in ["i_loadstep", "v_overshoot", "v_undershoot"]):
+            if all(inputs.get(key) is not None for key in ["i_loadstep", "v_overshoot", "v_undershoot"]):
                 c_out_transient = self.calculate_buck_output_cap_transient(
                     inductance,
                     inputs["i_loadstep"],
@@ -106,7 +109,9 @@ class CircuitCalculator:
                     inputs["v_overshoot"],
                     inputs["v_out_max"]
                 )
-                c_out = max(c_out_ripple, c_out_transient)
+                # Batch rows that leave a transient field blank get a NaN
+                # transient value, which fmax skips in favour of the ripple value
+                c_out = np.fmax(c_out_ripple, c_out_transient)
             else:
                 c_out = c_out_ripple
 
@@ -169,4 +174,23 @@ class CircuitCalculator:
         elif circuit_type == "Synchronous Buck":
             return self.calculate_buck_circuit(inputs)
         else:
-            raise ValueError("Invalid circuit type")
\ No newline at end of file
+            raise ValueError("Invalid circuit type")
+
+    def calculate_batch(self, circuit_type, batch):
+        """
+        Calculate a columnar batch of designs in one vectorized pass
+
+        Rows that fail validation are dropped before the calculation, so one
+        bad spec does not fail the whole batch.
+
+        Args:
+            circuit_type (str): Circuit type as accepted by calculate
+            batch (DataFrame or dict): One column per input field, one row per design
+
+        Returns:
+            tuple: (valid rows with their results as extra columns,
+            rejected rows with an 'Errors' column)
+        """
+        valid, rejected = drop_invalid(circuit_type, batch)
+        results = pd.DataFrame(self.calculate(circuit_type, valid), index=valid.index)
+        return valid.join(results), rejected
\ No newline at end of file
@@ -0,0 +1,224 @@
+import hashlib
+import io
+import os
+import threading
+from collections import namedtuple
+from types import MappingProxyType
+import pandas as pd
+from utils.mosfet_selector import MOSFET_DATA_PATH, normalize_mosfet_data
+from utils.capacitor_selector import CAPACITOR_DATA_PATH, normalize_capacitor_data
+from utils.inductor_selector import INDUCTOR_DATA_PATH, normalize_inductor_data
+
+# Catalog name -> (CSV path, row-wise normalizer)
+DEFAULT_SOURCES = {
+    "mosfets": (MOSFET_DATA_PATH, normalize_mosfet_data),
+    "capacitors": (CAPACITOR_DATA_PATH, normalize_capacitor_data),
+    "inductors": (INDUCTOR_DATA_PATH, normalize_inductor_data),
+}
+
+# Bytes kept from the end of each file to recognize pure appends
+TAIL_BYTES = 4096
+
+# Immutable view of all catalogs; the DataFrames must be treated as read-only.
+# content_id hashes the bytes the catalogs were parsed from, so equal
+# contents get equal ids whichever way they were loaded
+CatalogSnapshot = namedtuple('CatalogSnapshot', ['version', 'catalogs', 'content_id'])
+
+def _parse_rows(header, rows, dtypes, normalize, first_index):
+    """Parse and normalize CSV rows, numbering them from first_index."""
+    df = pd.read_csv(io.StringIO('\n'.join([header] + rows)), dtype=dtypes)
+    df = normalize(df)
+    df.index = pd.RangeIndex(first_index, first_index + len(df))
+    return df
+
+class CatalogManager:
+    """
+    Keeps normalized component catalogs in sync with their CSV files.
+
+    refresh() polls file mtimes and sizes. Appended rows are read from the
+    old end of file onwards; for other edits the file is diffed line by line
+    and only new or changed rows are parsed and normalized, while unchanged
+    rows are reused from the previous snapshot. Each change publishes a new
+    CatalogSnapshot with a higher version in a single reference swap, so
+    readers always see a complete, consistent set of catalogs. The
+    snapshot's content_id is a hash of exactly the bytes that were parsed,
+    so a partial line left for the next poll is not part of it.
+    """
+
+    def __init__(self, sources=None):
+        self.sources = sources or DEFAULT_SOURCES
+        self.last_error = None
+        self._lock = threading.Lock()
+        self._states = {}
+        self._snapshot = CatalogSnapshot(0, MappingProxyType({}), None)
+        self._stop_event = threading.Event()
+        self._thread = None
+        self.refresh()
+
+    @property
+    def snapshot(self):
+        """Current catalog snapshot."""
+        return self._snapshot
+
+    @property
+    def version(self):
+        """Version of the current snapshot; increases on every change."""
+        return self._snapshot.version
+
+    def refresh(self):
+        """
+        Pick up changes to the catalog files.
+
+        Returns:
+            bool: True if a new snapshot was published
+        """
+        with self._lock:
+            try:
+                states = dict(self._states)
+                changed = False
+                for name, (path, normalize) in self.sources.items():
+                    previous = states.get(name)
+                    state = self._sync(path, normalize, previous)
+                    if state is not None:
+                        states[name] = state
+                        # A touched but unedited file keeps its DataFrame
+                        changed |= previous is None or state["df"] is not previous["df"]
+                self._states = states
+                if not changed:
+                    return False
+
+                catalogs = {name: state["df"] for name, state in self._states.items()}
+                content = hashlib.sha256()
+                for name in sorted(self._states):
+                    content.update(f"{name}:{self._states[name]['digest'].hexdigest()}\n".encode())
+                self._snapshot = CatalogSnapshot(
+                    self._snapshot.version + 1, MappingProxyType(catalogs), content.hexdigest()
+                )
+                self.last_error = None
+                return True
+            except Exception as e:
+                # Keep serving the previous snapshot, e.g. while a file is half written
+                self.last_error = f"Error refreshing catalogs: {str(e)}"
+                if not self._snapshot.catalogs:
+                    raise Exception(self.last_error)
+                return False
+
+    def start(self, interval=2.0):
+        """Poll the catalog files from a daemon thread every interval seconds."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+
+        def poll():
+            while not self._stop_event.wait(interval):
+                self.refresh()
+
+        self._thread = threading.Thread(target=poll, name='catalog-poller', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the polling thread."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _sync(self, path, normalize, state):
+        """
+        Bring one catalog up to date with its file.
+
+        Returns:
+            dict: New catalog state, or None when the file is unchanged
+        """
+        stat = os.stat(path)
+        if state is not None and (stat.st_mtime_ns, stat.st_size) == (state["mtime_ns"], state["size"]):
+            return None
+
+        with open(path, 'rb') as f:
+            if state is not None and state["aligned"] and stat.st_size > state["size"] \
+                    and state["tail"].endswith(b'\n'):
+                f.seek(state["size"] - len(state["tail"]))
+                if f.read(len(state["tail"])) == state["tail"]:
+                    appended = self._append(state, f.read(), stat, normalize)
+                    if appended is not None:
+                        return appended
+                f.seek(0)
+            data = f.read()
+
+        text = data.decode('utf-8')
+        lines = [line for line in text.splitlines() if line.strip()]
+        header, rows = lines[0], lines[1:]
+        base = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": len(data),
+            "tail": data[-TAIL_BYTES:],
+            "digest": hashlib.sha256(data),
+            "header": header,
+            "lines": rows,
+        }
+
+        # Quoted fields spanning lines break the one-row-per-line diff
+        if state is None or not state["aligned"] or header != state["header"] \
+                or any(row.count('"') % 2 for row in rows):
+            raw = pd.read_csv(io.BytesIO(data))
+            dtypes = {
+                column: str for column, dtype in raw.dtypes.items()
+                if not pd.api.types.is_numeric_dtype(dtype)
+            }
+            df = normalize(raw)
+            return dict(base, df=df, dtypes=dtypes, aligned=len(df) == len(rows))
+
+        if rows == state["lines"]:
+            return dict(state, **base)
+
+        previous = {}
+        for position, row in enumerate(state["lines"]):
+            previous.setdefault(row, position)
+
+        reused_at, reused_from, added_at, added_rows = [], [], [], []
+        for position, row in enumerate(rows):
+            if row in previous:
+                reused_at.append(position)
+                reused_from.append(previous[row])
+            else:
+                added_at.append(position)
+                added_rows.append(row)
+
+        parts = [state["df"].iloc[reused_from].set_axis(reused_at)]
+        if added_rows:
+            added = _parse_rows(header, added_rows, state["dtypes"], normalize, 0)
+            parts.append(added.set_axis(added_at))
+        df = pd.concat(parts).sort_index()
+        df.index = pd.RangeIndex(len(df))
+        return dict(base, df=df, dtypes=state["dtypes"], aligned=True)
+
+    def _append(self, state, appended, stat, normalize):
+        """
+        Extend a catalog with rows appended after its previous end of file.
+
+        Returns:
+            dict: New catalog state, or None if the rows need a full diff
+        """
+        # A trailing partial line is left for the next poll
+        complete = appended[:appended.rfind(b'\n') + 1]
+        rows = [line for line in complete.decode('utf-8').splitlines() if line.strip()]
+        if any(row.count('"') % 2 for row in rows):
+            return None
+
+        df = state["df"]
+        if rows:
+            added = _parse_rows(state["header"], rows, state["dtypes"], normalize, len(df))
+            df = pd.concat([df, added])
+        # Hash only the bytes consumed, the same digest a full read of them gives
+        digest = state["digest"].copy()
+        digest.update(complete)
+        return dict(
+            state,
+            # Record the mtime only once the whole append has been consumed
+            mtime_ns=stat.st_mtime_ns if len(complete) == len(appended) else state["mtime_ns"],
+            size=state["size"] + len(complete),
+            tail=(state["tail"] + complete)[-TAIL_BYTES:],
+            digest=digest,
+            lines=state["lines"] + rows,
+            df=df
+        )
@@ -0,0 +1,67 @@
+import math
+import pandas as pd
+
+def filter_components(df, ranges=None, categories=None):
+    """
+    Filter a normalized component catalog on numeric ranges and category values.
+
+    Args:
+        df (DataFrame): Normalized catalog from one of the load_*_data functions
+        ranges (dict): Column name -> (min, max); either bound may be None
+        categories (dict): Column name -> list of allowed values; empty means all
+
+    Returns:
+        Index: Index labels of the matching rows
+    """
+    mask = pd.Series(True, index=df.index)
+    for column, (low, high) in (ranges or {}).items():
+        if low is not None:
+            mask &= df[column] >= low
+        if high is not None:
+            mask &= df[column] <= high
+    for column, values in (categories or {}).items():
+        if values:
+            mask &= df[column].isin(values)
+    return df.index[mask.to_numpy()]
+
+def query_components(df, ranges=None, categories=None, sort_by=None, ascending=True,
+                     page=1, page_size=25, columns=None):
+    """
+    Filter, sort and paginate a component catalog without copying the full frame.
+
+    Only the index labels are filtered and sorted; the requested columns are
+    materialized for the rows of the selected page alone, so the cost of
+    styling and serializing the result does not grow with the catalog.
+
+    Args:
+        df (DataFrame): Normalized catalog from one of the load_*_data functions
+        ranges (dict): Column name -> (min, max) numeric bounds
+        categories (dict): Column name -> list of allowed values
+        sort_by (str): Column to sort on, or None to keep catalog order
+        ascending (bool): Sort direction
+        page (int): 1-based page number, clamped to the available pages
+        page_size (int): Number of rows per page
+        columns (list): Columns to return, or None for all columns
+
+    Returns:
+        tuple: (page DataFrame, total matching rows, page count, current page)
+    """
+    try:
+        index = filter_components(df, ranges, categories)
+
+        if sort_by:
+            index = df.loc[index, sort_by].sort_values(
+                ascending=ascending,
+                na_position='last',
+                kind='mergesort'
+            ).index
+
+        total_rows = len(index)
+        page_count = max(1, math.ceil(total_rows / page_size))
+        page = min(max(int(page), 1), page_count)
+        start = (page - 1) * page_size
+
+        page_df = df.loc[index[start:start + page_size], columns if columns else df.columns]
+        return page_df, total_rows, page_count, page
+    except Exception as e:
+        raise Exception(f"Error querying components: {str(e)}")
@@ -0,0 +1,223 @@
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+
+BASE_DIR = os.path.dirname(os.path.dirname(__file__))
+
+# Input fields copied into indexed columns for bulk queries
+INDEXED_FIELDS = ['switching_freq', 'p_out_max', 'v_in_max', 'v_out_max']
+
+def _to_builtin(value):
+    """JSON fallback for numpy scalars found in DataFrame records."""
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+def normalize_inputs(inputs):
+    """
+    Normalize calculation inputs so equal specs produce equal keys.
+
+    Numeric values are rounded to 12 significant digits to absorb float
+    noise from the UI; keys are sorted by the JSON encoder.
+    """
+    normalized = {}
+    for name, value in inputs.items():
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            value = float(f"{float(value):.12g}")
+        normalized[name] = value
+    return normalized
+
+def design_key(circuit_type, inputs, catalog_version):
+    """
+    Canonical hash of (circuit type, normalized inputs, catalog version).
+
+    Returns:
+        str: Hex digest used as the primary key of the store
+    """
+    payload = json.dumps(
+        [circuit_type, normalize_inputs(inputs), catalog_version],
+        sort_keys=True,
+        separators=(',', ':'),
+        default=_to_builtin
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+class DesignStore:
+    """
+    Persistent SQLite store of calculated designs and their selected parts.
+
+    Entries are content addressed by design_key, so repeated specs are served
+    from disk. The store holds at most max_entries designs and evicts the
+    least recently used ones beyond that.
+    """
+
+    def __init__(self, path=None, max_entries=10000):
+        self.path = path or os.path.join(BASE_DIR, 'design_store.sqlite3')
+        self.max_entries = max_entries
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS designs (
+                    key TEXT PRIMARY KEY,
+                    circuit_type TEXT NOT NULL,
+                    catalog_version TEXT,
+                    {', '.join(f'{field} REAL' for field in INDEXED_FIELDS)},
+                    inputs TEXT NOT NULL,
+                    results TEXT NOT NULL,
+                    parts TEXT,
+                    created REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_designs_type_fs "
+                "ON designs (circuit_type, switching_freq)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_designs_last_access "
+                "ON designs (last_access)"
+            )
+
+    @contextmanager
+    def _connect(self):
+        # One short-lived connection per operation keeps the store usable
+        # from Streamlit's per-session script threads
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, circuit_type, inputs, catalog_version):
+        """
+        Look up a stored design.
+
+        Returns:
+            dict: {"results": ..., "parts": ...} or None if not stored
+        """
+        key = design_key(circuit_type, inputs, catalog_version)
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT results, parts FROM designs WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                conn.execute(
+                    "UPDATE designs SET last_access = ? WHERE key = ?", (time.time(), key)
+                )
+            return {
+                "results": json.loads(row[0]),
+                "parts": json.loads(row[1]) if row[1] else {}
+            }
+        except Exception as e:
+            raise Exception(f"Error reading design store: {str(e)}")
+
+    def put(self, circuit_type, inputs, results, catalog_version, parts=None):
+        """
+        Store a calculated design and its selected parts, evicting LRU entries.
+
+        Storing an existing design updates its results and parts but keeps
+        its creation time.
+
+        Args:
+            circuit_type (str): Circuit type passed to CircuitCalculator.calculate
+            inputs (dict): Calculation inputs
+            results (dict): Calculation results
+            catalog_version (str): Content id of the catalog snapshot the parts came from
+            parts (dict): Selected parts keyed by component kind
+        """
+        key = design_key(circuit_type, inputs, catalog_version)
+        normalized = normalize_inputs(inputs)
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    f"""
+                    INSERT INTO designs (
+                        key, circuit_type, catalog_version, {', '.join(INDEXED_FIELDS)},
+                        inputs, results, parts, created, last_access
+                    ) VALUES ({', '.join('?' * (len(INDEXED_FIELDS) + 8))})
+                    ON CONFLICT(key) DO UPDATE SET
+                        results = excluded.results,
+                        parts = excluded.parts,
+                        last_access = excluded.last_access
+                    """,
+                    (
+                        key, circuit_type, catalog_version,
+                        *[normalized.get(field) for field in INDEXED_FIELDS],
+                        json.dumps(normalized, sort_keys=True, default=_to_builtin),
+                        json.dumps(results, default=_to_builtin),
+                        json.dumps(parts or {}, default=_to_builtin),
+                        now, now
+                    )
+                )
+                conn.execute(
+                    """
+                    DELETE FROM designs WHERE key IN (
+                        SELECT key FROM designs ORDER BY last_access DESC
+                        LIMIT -1 OFFSET ?
+                    )
+                    """,
+                    (self.max_entries,)
+                )
+            return key
+        except Exception as e:
+            raise Exception(f"Error writing design store: {str(e)}")
+
+    def query(self, circuit_type=None, ranges=None, catalog_version=None, limit=None):
+        """
+        Bulk query stored designs, e.g. all buck designs with Fs >= 400 kHz:
+        query("Synchronous Buck", ranges={"switching_freq": (400e3, None)})
+
+        Args:
+            circuit_type (str): Restrict to one circuit type
+            ranges (dict): Indexed field -> (min, max); either bound may be None
+            catalog_version (str): Restrict to one catalog version
+            limit (int): Maximum number of designs returned
+
+        Returns:
+            list: Stored designs as dicts with inputs, results and parts
+        """
+        clauses, params = [], []
+        if circuit_type is not None:
+            clauses.append("circuit_type = ?")
+            params.append(circuit_type)
+        if catalog_version is not None:
+            clauses.append("catalog_version = ?")
+            params.append(catalog_version)
+        for field, (low, high) in (ranges or {}).items():
+            if field not in INDEXED_FIELDS:
+                raise ValueError(f"Field '{field}' is not indexed in the design store")
+            if low is not None:
+                clauses.append(f"{field} >= ?")
+                params.append(low)
+            if high is not None:
+                clauses.append(f"{field} <= ?")
+                params.append(high)
+
+        sql = "SELECT key, circuit_type, catalog_version, inputs, results, parts FROM designs"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY last_access DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+
+        with self._connect() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [
+            {
+                "key": key,
+                "circuit_type": row_type,
+                "catalog_version": version,
+                "inputs": json.loads(inputs),
+                "results": json.loads(results),
+                "parts": json.loads(parts) if parts else {}
+            }
+            for key, row_type, version, inputs, results, parts in rows
+        ]
@@ -0,0 +1,316 @@
+import math
+import numpy as np
+import pandas as pd
+from utils.calculations import CircuitCalculator
+from utils.mosfet_selector import load_mosfet_data
+from utils.inductor_selector import load_inductor_data
+from utils.validators import validate_inputs
+
+# Steinmetz exponents typical of power ferrites; the coefficient depends on
+# the core material and size and is passed to optimize_switching_frequency
+CORE_LOSS_REFERENCE_FREQ = 100e3
+STEINMETZ_ALPHA = 1.5
+STEINMETZ_BETA = 2.5
+
+# Frequency above which the ripple current sees skin-effect resistance
+AC_RESISTANCE_REFERENCE_FREQ = 100e3
+
+# Pair x frequency evaluations per chunk, bounds memory for large catalogs
+CHUNK_SIZE = 2 ** 18
+
+def parse_resistance(value):
+    """Convert a resistance string like '0.05Ω' or '12mΩ' to ohms."""
+    if pd.isna(value):
+        return np.nan
+    value = str(value).strip().replace('Ω', '').replace('Ohm', '')
+    try:
+        if value.endswith('m'):
+            return float(value[:-1]) * 1e-3
+        return float(value)
+    except ValueError:
+        return np.nan
+
+def _operating_point(circuit_type, inputs, calculator):
+    """
+    Worst-case operating point of the power stage.
+
+    Returns:
+        dict: load current, DC peak current, switched voltage, the spec ripple
+        and the peak current at that ripple used to rate the MOSFETs
+    """
+    if circuit_type == "Synchronous Buck":
+        d_max = calculator.calculate_duty_cycle_max(inputs["v_out_max"], inputs["v_in_min"])
+        i_load = inputs["p_out_max"] / inputs["v_out_min"]
+        return {
+            "i_rms": i_load,
+            "i_switched": i_load,
+            "i_dc_peak": i_load,
+            "i_peak": i_load + inputs["i_out_ripple"] / 2,
+            "v_switched": inputs["v_in_max"],
+            "i_ripple": inputs["i_out_ripple"],
+            "d_max": d_max
+        }
+    elif circuit_type == "Totem Pole PFC":
+        # Input current at low line; switching loss sees the rectified average
+        i_in = inputs["p_out_max"] / (inputs["v_in_min"] * inputs["efficiency"])
+        i_ripple = calculator.calculate_ripple_current(
+            inputs["p_out_max"], inputs["v_in_max"], inputs["efficiency"]
+        )
+        return {
+            "i_rms": i_in,
+            "i_switched": i_in * 2 * math.sqrt(2) / math.pi,
+            "i_dc_peak": i_in * math.sqrt(2),
+            "i_peak": i_in * math.sqrt(2) + i_ripple / 2,
+            "v_switched": inputs["v_out_max"],
+            "i_ripple": i_ripple
+        }
+    else:
+        raise ValueError("Invalid circuit type")
+
+def _ripple_current(circuit_type, inputs, calculator, op, inductance, f_s):
+    """
+    Ripple current of a fixed inductance at f_s (works on arrays).
+
+    Both sizing formulas have the form L = k / (Fs × ΔI), so passing the
+    inductance in place of the ripple returns ΔI = k / (Fs × L).
+    """
+    if circuit_type == "Synchronous Buck":
+        return calculator.calculate_buck_inductance(
+            inputs["v_in_max"], inputs["v_out_min"], op["d_max"], f_s, inductance
+        )
+    return calculator.calculate_inductance(inputs["v_out_max"], f_s, inductance)
+
+def _losses(circuit_type, inputs, calculator, op, rds_on, q_g, inductance, dcr,
+            current_rating, f_s, gate_drive_current, gate_drive_voltage,
+            core_loss_coefficient):
+    """
+    Loss breakdown of each MOSFET/inductor pair at f_s.
+
+    The catalog inductance is fixed, so the ripple current falls as 1/Fs and
+    drives the AC conduction, winding and core losses. All part arrays
+    broadcast against f_s, so a whole (pairs x frequencies) grid is
+    evaluated in one pass.
+    """
+    ripple = _ripple_current(circuit_type, inputs, calculator, op, inductance, f_s)
+    i_ac_sq = ripple ** 2 / 12
+    i_dc_sq = op["i_rms"] ** 2
+
+    conduction = (i_dc_sq + i_ac_sq) * rds_on
+    # Rise plus fall time approximated as 2 * Qg / I_gate, hard switched
+    switching = op["v_switched"] * op["i_switched"] * (q_g / gate_drive_current) * f_s
+    gate = 2 * q_g * gate_drive_voltage * f_s
+
+    # Skin effect raises the resistance seen by the ripple above the reference frequency
+    skin = np.maximum(1.0, np.sqrt(f_s / AC_RESISTANCE_REFERENCE_FREQ))
+    winding = (i_dc_sq + i_ac_sq * skin) * dcr
+    # Steinmetz core loss; the flux swing relative to the flux at the rated
+    # current equals ripple / rating, the core volume follows the stored energy
+    core = 0.0
+    if core_loss_coefficient:
+        core = (
+            core_loss_coefficient * 0.5 * inductance * current_rating ** 2
+            * (f_s / CORE_LOSS_REFERENCE_FREQ) ** STEINMETZ_ALPHA
+            * (ripple / current_rating) ** STEINMETZ_BETA
+        )
+
+    total = conduction + switching + gate + winding + core
+    return {
+        "conduction": conduction,
+        "switching": switching,
+        "gate": gate,
+        "winding": winding,
+        "core": np.broadcast_to(core, np.shape(total)),
+        "total": total,
+        "ripple": ripple
+    }
+
+def _output_capacitance(circuit_type, inputs, calculator, ripple, f_s):
+    """Output capacitance for the voltage ripple spec at the given ripple current and f_s."""
+    if circuit_type == "Synchronous Buck":
+        return calculator.calculate_buck_output_cap_ripple(ripple, f_s, inputs["v_ripple_max"])
+    return np.full(np.shape(f_s), calculator.calculate_min_capacitance(
+        inputs["p_out_max"], inputs["line_freq_min"], inputs["v_ripple_max"], inputs["v_out_max"]
+    ))
+
+def _non_dominated(costs):
+    """
+    Mask of the rows no other row beats, i.e. is no worse on every cost and
+    better on at least one. Identical rows do not beat each other.
+
+    Rows are compared with the whole set in blocks so memory stays bounded.
+    """
+    costs = np.asarray(costs, dtype=float)
+    keep = np.ones(len(costs), dtype=bool)
+    block = max(1, CHUNK_SIZE // max(len(costs), 1))
+    for start in range(0, len(costs), block):
+        rows = costs[start:start + block, None, :]
+        beaten = (costs[None] <= rows).all(axis=2) & (costs[None] < rows).any(axis=2)
+        keep[start:start + block] = ~beaten.any(axis=1)
+    return keep
+
+def _top_k(total, k):
+    """Positions of the k smallest totals, in no particular order."""
+    if k is None or len(total) <= k:
+        return np.arange(len(total))
+    return np.argpartition(total, k - 1)[:k]
+
+def optimize_switching_frequency(circuit_type, inputs, fs_min=20e3, fs_max=2e6,
+                                 grid_points=32, refinements=4,
+                                 gate_drive_current=1.0, gate_drive_voltage=10.0,
+                                 core_loss_coefficient=0.0, top_k=10,
+                                 mosfets_df=None, inductors_df=None):
+    """
+    Find the loss-minimizing switching frequency for each MOSFET/inductor pair.
+
+    Every pair is a fixed bill of materials: the inductor keeps its catalog
+    inductance and its ripple current, ΔI = k / (Fs × L), sets the ripple
+    losses and the output capacitance at each Fs. Each pair is searched on a
+    log-spaced coarse-to-fine grid from the lowest Fs at which the ripple
+    meets the spec and the peak current keeps 20% margin below the inductor
+    rating, up to fs_max.
+
+    Parts another part beats on every loss term are dropped first: MOSFETs
+    with both higher Rds(on) and higher Qg, and inductors with higher DCR and
+    no more inductance or current rating. The remaining pairs are evaluated
+    in chunks of (pairs x grid) arrays and only the best top_k are kept.
+
+    Args:
+        circuit_type (str): "Synchronous Buck" or "Totem Pole PFC"
+        inputs (dict): Same inputs as CircuitCalculator.calculate
+        fs_min (float): Lowest switching frequency considered in Hz
+        fs_max (float): Highest switching frequency considered in Hz
+        grid_points (int): Frequencies evaluated per pair and refinement step
+        refinements (int): Number of coarse-to-fine steps
+        gate_drive_current (float): Gate driver current in A
+        gate_drive_voltage (float): Gate drive voltage in V
+        core_loss_coefficient (float): Steinmetz coefficient of the inductor
+            cores in W per J of rated stored energy (½ × L × I_rated²) at
+            100 kHz and a flux swing equal to the flux at the rated current.
+            The catalogs carry no core data, so core loss is left out unless
+            a value for the core material is given
+        top_k (int): Number of pairs returned, or None for all of them
+        mosfets_df (DataFrame): Normalized MOSFET catalog, loaded if None
+        inductors_df (DataFrame): Normalized inductor catalog, loaded if None
+
+    Returns:
+        list: The top_k feasible pairs with their optimal Fs and loss
+        breakdown, sorted by total loss
+    """
+    try:
+        input_errors = validate_inputs(circuit_type, inputs)
+        if input_errors:
+            raise ValueError("; ".join(f"{field} {reason}" for field, reason in input_errors.items()))
+
+        calculator = CircuitCalculator()
+        op = _operating_point(circuit_type, inputs, calculator)
+
+        if mosfets_df is None:
+            mosfets_df = load_mosfet_data()
+        mosfets_df = mosfets_df.assign(
+            Rds=pd.to_numeric(mosfets_df['Rds(on) (mΩ)'], errors='coerce') * 1e-3,
+            Qg=pd.to_numeric(mosfets_df['Qg (nC)'], errors='coerce') * 1e-9
+        )
+        mosfets_df = mosfets_df[
+            (mosfets_df['Input Voltage'] >= op["v_switched"] * 1.2) &
+            (mosfets_df['Current Rating'] >= op["i_peak"] * 1.2)
+        ].dropna(subset=['Rds', 'Qg'])
+        mosfets_df = mosfets_df[_non_dominated(mosfets_df[['Rds', 'Qg']].to_numpy())]
+
+        if inductors_df is None:
+            inductors_df = load_inductor_data()
+        inductors_df = inductors_df.assign(DCR=inductors_df['DC Resistance'].apply(parse_resistance))
+        inductors_df = inductors_df[
+            (inductors_df['Inductance'] > 0) & (inductors_df['Current Rating'] > 0)
+        ].dropna(subset=['DCR'])
+
+        # Ripple falls as 1/Fs, so the spec ripple and the saturation margin
+        # (DC peak + ΔI/2 within rating / 1.2) each set a lowest Fs per inductor
+        inductance = inductors_df['Inductance'].to_numpy(dtype=float)
+        current_rating = inductors_df['Current Rating'].to_numpy(dtype=float)
+        headroom = 2 * (current_rating / 1.2 - op["i_dc_peak"])
+        max_ripple = np.minimum(op["i_ripple"], headroom)
+        with np.errstate(divide='ignore'):
+            fs_floor = np.where(
+                max_ripple > 0,
+                _ripple_current(circuit_type, inputs, calculator, op, inductance, 1.0) / max_ripple,
+                np.inf
+            )
+        inductors_df = inductors_df.assign(Floor=np.maximum(fs_floor, fs_min))
+        inductors_df = inductors_df[inductors_df['Floor'] <= fs_max]
+        inductors_df = inductors_df[_non_dominated(np.column_stack([
+            inductors_df['DCR'].to_numpy(dtype=float),
+            -inductors_df['Inductance'].to_numpy(dtype=float),
+            -inductors_df['Current Rating'].to_numpy(dtype=float)
+        ]))]
+
+        if len(mosfets_df) == 0 or len(inductors_df) == 0:
+            return []
+
+        parts = {
+            "rds_on": mosfets_df['Rds'].to_numpy(dtype=float),
+            "q_g": mosfets_df['Qg'].to_numpy(dtype=float),
+            "inductance": inductors_df['Inductance'].to_numpy(dtype=float),
+            "dcr": inductors_df['DCR'].to_numpy(dtype=float),
+            "current_rating": inductors_df['Current Rating'].to_numpy(dtype=float),
+            "floor": inductors_df['Floor'].to_numpy(dtype=float)
+        }
+        loss_args = (gate_drive_current, gate_drive_voltage, core_loss_coefficient)
+
+        def pair_losses(m_idx, i_idx, f_s):
+            return _losses(
+                circuit_type, inputs, calculator, op,
+                parts["rds_on"][m_idx], parts["q_g"][m_idx], parts["inductance"][i_idx],
+                parts["dcr"][i_idx], parts["current_rating"][i_idx], f_s, *loss_args
+            )
+
+        # Pairs are numbered m * n_inductors + i and searched a chunk at a time,
+        # keeping only the running top_k
+        n_inductors = len(inductors_df)
+        n_pairs = len(mosfets_df) * n_inductors
+        pairs_per_chunk = max(1, CHUNK_SIZE // grid_points)
+        steps = np.linspace(0.0, 1.0, grid_points)
+        best_pair = np.empty(0, dtype=int)
+        best_fs = np.empty(0)
+        best_total = np.empty(0)
+        for start in range(0, n_pairs, pairs_per_chunk):
+            pair = np.arange(start, min(start + pairs_per_chunk, n_pairs))
+            m_idx, i_idx = np.divmod(pair, n_inductors)
+            low = parts["floor"][i_idx]
+            high = np.full_like(low, fs_max)
+            rows = np.arange(len(pair))
+            for _ in range(refinements):
+                grid = low[:, None] * (high / low)[:, None] ** steps
+                total = pair_losses(m_idx[:, None], i_idx[:, None], grid)["total"]
+                best = np.argmin(total, axis=1)
+                low = grid[rows, np.maximum(best - 1, 0)]
+                high = grid[rows, np.minimum(best + 1, grid_points - 1)]
+
+            best_pair = np.concatenate([best_pair, pair])
+            best_fs = np.concatenate([best_fs, grid[rows, best]])
+            best_total = np.concatenate([best_total, total[rows, best]])
+            keep = _top_k(best_total, top_k)
+            best_pair, best_fs, best_total = best_pair[keep], best_fs[keep], best_total[keep]
+
+        order = np.argsort(best_total, kind='stable')
+        pair, f_s = best_pair[order], best_fs[order]
+        m_idx, i_idx = np.divmod(pair, n_inductors)
+        losses = pair_losses(m_idx, i_idx, f_s)
+        results = pd.DataFrame({
+            'MOSFET': mosfets_df['Part Name'].to_numpy()[m_idx],
+            'Inductor': inductors_df['Part Name'].to_numpy()[i_idx],
+            'Switching Frequency': f_s,
+            'Total Loss': losses["total"],
+            'Conduction Loss': losses["conduction"],
+            'Switching Loss': losses["switching"],
+            'Gate Loss': losses["gate"],
+            'Winding Loss': losses["winding"],
+            'Core Loss': losses["core"],
+            'Inductance': parts["inductance"][i_idx],
+            'Ripple Current': losses["ripple"],
+            'Output Capacitance': _output_capacitance(
+                circuit_type, inputs, calculator, losses["ripple"], f_s
+            )
+        })
+        return results.to_dict('records')
+    except Exception as e:
+        raise Exception(f"Error optimizing switching frequency: {str(e)}")
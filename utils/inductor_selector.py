@@ -1,36 +1,42 @@
 import pandas as pd
 import os
 
+INDUCTOR_DATA_PATH = os.path.join(os.path.dirname(__file__), 'Assets', 'Top_Inductors_2025.csv')
+
+def normalize_inductor_data(df):
+    """Convert raw inductor CSV rows to numeric units (row by row)."""
+    # Clean inductance data (convert all to H)
+    df['Inductance'] = df['Inductance'].apply(lambda x: 
+        float(x.replace('mH', 'e-3').replace('µH', 'e-6').replace('H', ''))
+    )
+    # Clean current data
+    df['Current Rating'] = df['Current Rating'].str.replace('A', '').astype(float)
+    # Clean price data
+    df['Price'] = df['Price'].str.replace('$', '').astype(float)
+    return df
+
 def load_inductor_data():
     """Load inductor data from CSV file."""
-    file_path = os.path.join(os.path.dirname(__file__), 'Assets', 'Top_Inductors_2025.csv')
     try:
-        df = pd.read_csv(file_path)
-        # Clean inductance data (convert all to H)
-        df['Inductance'] = df['Inductance'].apply(lambda x: 
-            float(x.replace('mH', 'e-3').replace('µH', 'e-6').replace('H', ''))
-        )
-        # Clean current data
-        df['Current Rating'] = df['Current Rating'].str.replace('A', '').astype(float)
-        # Clean price data
-        df['Price'] = df['Price'].str.replace('$', '').astype(float)
-        return df
+        return normalize_inductor_data(pd.read_csv(INDUCTOR_DATA_PATH))
     except Exception as e:
         raise Exception(f"Error loading inductor data: {str(e)}")
 
-def suggest_inductors(inductance_requirement, current_requirement):
+def suggest_inductors(inductance_requirement, current_requirement, inductors_df=None):
     """
     Suggest suitable inductors based on inductance and current requirements.
     
     Args:
         inductance_requirement (float): Required inductance in H
         current_requirement (float): Required current rating in A
+        inductors_df (DataFrame): Normalized inductor catalog, loaded from CSV if None
     
     Returns:
         list: List of suitable inductors with their details
     """
     try:
-        inductors_df = load_inductor_data()
+        if inductors_df is None:
+            inductors_df = load_inductor_data()
         
         # Add 20% margin for inductance and current ratings
         inductance_with_margin = inductance_requirement * 0.8  # Allow 20% lower for inductance
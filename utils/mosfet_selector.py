@@ -1,50 +1,55 @@
 import pandas as pd
 import os
 
+MOSFET_DATA_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'Assets', 'optivolt_mosfet_dataset.csv')
+
+def normalize_mosfet_data(df):
+    """Convert raw MOSFET CSV rows to the standard columns (row by row)."""
+    # Create consistent column names
+    df = df.rename(columns={
+        'MOSFET Name': 'Part Name',
+        'Vds (V)': 'Input Voltage',
+        'Continuous Id (A)': 'Current Rating',
+        'Package': 'Package Type'
+    })
+    
+    # Convert voltage and current to float
+    df['Input Voltage'] = pd.to_numeric(df['Input Voltage'], errors='coerce')
+    df['Current Rating'] = pd.to_numeric(df['Current Rating'], errors='coerce')
+    
+    # Add standard columns if missing
+    if 'Price' not in df.columns:
+        df['Price'] = 0.0
+    if 'Efficiency/Performance' not in df.columns:
+        df['Efficiency/Performance'] = df['Efficiency Range'].fillna('N/A')
+    if 'Supplier Link' not in df.columns:
+        df['Supplier Link'] = df['Datasheet URL']
+    
+    return df
+
 def load_mosfet_data():
     """Load MOSFET data from CSV file."""
-    file_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'Assets', 'optivolt_mosfet_dataset.csv')
     try:
         # Read CSV with comma delimiter
-        df = pd.read_csv(file_path)
-        
-        # Create consistent column names
-        df = df.rename(columns={
-            'MOSFET Name': 'Part Name',
-            'Vds (V)': 'Input Voltage',
-            'Continuous Id (A)': 'Current Rating',
-            'Package': 'Package Type'
-        })
-        
-        # Convert voltage and current to float
-        df['Input Voltage'] = pd.to_numeric(df['Input Voltage'], errors='coerce')
-        df['Current Rating'] = pd.to_numeric(df['Current Rating'], errors='coerce')
-        
-        # Add standard columns if missing
-        if 'Price' not in df.columns:
-            df['Price'] = 0.0
-        if 'Efficiency/Performance' not in df.columns:
-            df['Efficiency/Performance'] = df['Efficiency Range'].fillna('N/A')
-        if 'Supplier Link' not in df.columns:
-            df['Supplier Link'] = df['Datasheet URL']
-        
-        return df
+        return normalize_mosfet_data(pd.read_csv(MOSFET_DATA_PATH))
     except Exception as e:
         raise Exception(f"Error loading MOSFET data: {str(e)}")
 
-def suggest_mosfets(voltage_requirement, current_requirement):
+def suggest_mosfets(voltage_requirement, current_requirement, mosfets_df=None):
     """
     Suggest suitable MOSFETs based on voltage and current requirements.
     
     Args:
         voltage_requirement (float): Required voltage rating in V
         current_requirement (float): Required current rating in A
+        mosfets_df (DataFrame): Normalized MOSFET catalog, loaded from CSV if None
     
     Returns:
         list: List of suitable MOSFETs with their details
     """
     try:
-        mosfets_df = load_mosfet_data()
+        if mosfets_df is None:
+            mosfets_df = load_mosfet_data()
         
         # Filter MOSFETs based on requirements
         # Add 20% margin for voltage and current ratings
@@ -54,7 +59,7 @@ def suggest_mosfets(voltage_requirement, current_requirement):
         suitable_mosfets = mosfets_df[
             (mosfets_df['Input Voltage'] >= voltage_with_margin) &
             (mosfets_df['Current Rating'] >= current_with_margin)
-        ]
+        ].copy()  # Make a copy so the shared catalog is never modified
         
         # Sort by price and efficiency range
         # Convert efficiency range to numeric value (take the average of the range)
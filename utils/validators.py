@@ -1,18 +1,142 @@
-def validate_input(inputs):
+import math
+import numpy as np
+import pandas as pd
+
+# Inputs each circuit calculation needs
+REQUIRED_FIELDS = {
+    "Totem Pole PFC": [
+        "v_in_min", "v_in_max", "v_out_min", "v_out_max", "p_out_max",
+        "efficiency", "switching_freq", "line_freq_min", "v_ripple_max"
+    ],
+    "Synchronous Buck": [
+        "v_in_min", "v_in_max", "v_out_min", "v_out_max", "p_out_max",
+        "efficiency", "switching_freq", "v_ripple_max", "v_in_ripple", "i_out_ripple"
+    ]
+}
+
+# Checked when present and not blank; the buck transient capacitance only
+# uses them in rows that give all three
+OPTIONAL_FIELDS = {
+    "Totem Pole PFC": [],
+    "Synchronous Buck": ["i_loadstep", "v_overshoot", "v_undershoot"]
+}
+
+def _physics_rules(circuit_type):
     """
-    Validate input parameters for circuit calculations
-    
+    Topology-specific consistency rules as (field, reason, check) tuples.
+
+    Each check receives the dict of numeric columns and returns a boolean
+    array marking the rows that break the rule. Comparisons with NaN are
+    False, so missing or non-numeric values are only reported once.
+    """
+    rules = [
+        ("efficiency", "must not exceed 1", lambda c: c["efficiency"] > 1),
+        ("v_in_max", "must not be below v_in_min", lambda c: c["v_in_max"] < c["v_in_min"]),
+        ("v_out_max", "must not be below v_out_min", lambda c: c["v_out_max"] < c["v_out_min"]),
+    ]
+    if circuit_type == "Synchronous Buck":
+        rules += [
+            ("v_out_max", "must be below v_in_min (duty cycle would exceed 1)",
+             lambda c: c["v_out_max"] >= c["v_in_min"]),
+            ("v_ripple_max", "must be below v_out_min",
+             lambda c: c["v_ripple_max"] >= c["v_out_min"]),
+            ("v_undershoot", "must be below v_out_min",
+             lambda c: c["v_undershoot"] >= c["v_out_min"]),
+        ]
+    elif circuit_type == "Totem Pole PFC":
+        rules += [
+            ("v_out_min", "must exceed the peak input voltage (√2 × v_in_max)",
+             lambda c: c["v_out_min"] <= math.sqrt(2) * c["v_in_max"]),
+            ("v_ripple_max", "must be below v_out_max",
+             lambda c: c["v_ripple_max"] >= c["v_out_max"]),
+        ]
+    return rules
+
+def validate_batch(circuit_type, batch):
+    """
+    Validate a columnar batch of circuit inputs in one vectorized pass.
+
+    Args:
+        circuit_type (str): "Totem Pole PFC" or "Synchronous Buck"
+        batch (DataFrame or dict): One column per input field, one row per design
+
+    Returns:
+        tuple: (valid, errors) where valid is a boolean array with one entry
+        per row and errors is a DataFrame of the same rows with one column per
+        field holding the reasons a value was rejected ('' when it is valid)
+    """
+    if circuit_type not in REQUIRED_FIELDS:
+        raise ValueError("Invalid circuit type")
+
+    batch = pd.DataFrame(batch)
+    n_rows = len(batch)
+    required = REQUIRED_FIELDS[circuit_type]
+    fields = required + [f for f in OPTIONAL_FIELDS[circuit_type] if f in batch.columns]
+
+    columns = {}
+    reasons = {field: np.full(n_rows, '', dtype=object) for field in fields}
+    invalid = np.zeros(n_rows, dtype=bool)
+
+    def flag(field, bad, reason):
+        nonlocal invalid
+        bad = np.broadcast_to(np.asarray(bad, dtype=bool), (n_rows,))
+        invalid |= bad
+        column = reasons[field]
+        # Reason strings are only built for the rejected rows
+        for i in np.flatnonzero(bad):
+            column[i] = f"{column[i]}; {reason}" if column[i] else reason
+
+    for field in fields:
+        if field not in batch.columns:
+            columns[field] = np.full(n_rows, np.nan)
+            flag(field, True, "is required")
+            continue
+        raw = batch[field]
+        values = pd.to_numeric(raw, errors='coerce').to_numpy(dtype=float)
+        columns[field] = values
+        nan = np.isnan(values)
+        flag(field, nan & raw.notna().to_numpy(), "must be a number")
+        # A blank optional value means the row does not provide it
+        if field in required:
+            flag(field, nan & raw.isna().to_numpy(), "is required")
+        flag(field, values <= 0, "must be positive")
+
+    for field, reason, check in _physics_rules(circuit_type):
+        # Rules on optional fields only apply when the batch provides them;
+        # blank values compare False, so they are skipped row by row
+        if field in reasons:
+            flag(field, check(columns), reason)
+
+    errors = pd.DataFrame(reasons, index=batch.index)
+    return ~invalid, errors
+
+def drop_invalid(circuit_type, batch):
+    """
+    Split a batch into valid rows and rejected rows with their reasons.
+
+    Returns:
+        tuple: (valid rows, rejected rows); rejected rows carry an extra
+        'Errors' column summarizing every failed check
+    """
+    batch = pd.DataFrame(batch)
+    valid, errors = validate_batch(circuit_type, batch)
+    rejected = batch[~valid].copy()
+    rejected['Errors'] = [
+        "; ".join(f"{field} {reason}" for field, reason in row.items() if reason)
+        for _, row in errors[~valid].iterrows()
+    ]
+    return batch[valid], rejected
+
+def validate_inputs(circuit_type, inputs):
+    """
+    Validate a single set of circuit inputs.
+
     Args:
+        circuit_type (str): "Totem Pole PFC" or "Synchronous Buck"
         inputs (dict): Dictionary containing input parameters
-        
+
     Returns:
-        bool: True if all inputs are valid, False otherwise
-    """
-    try:
-        # Check if all values are positive
-        for value in inputs.values():
-            if value <= 0:
-                return False
-        return True
-    except Exception:
-        return False
\ No newline at end of file
+        dict: Field name -> reason for every invalid field, empty if valid
+    """
+    _, errors = validate_batch(circuit_type, pd.DataFrame([inputs]))
+    return {field: reason for field, reason in errors.iloc[0].items() if reason}